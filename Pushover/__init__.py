@@ -1,10 +1,62 @@
+import os
+import time
+import random
+import mimetypes
 import requests
-from enum import Enum
+from urllib.parse import urlencode
+from enum import IntEnum
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import Optional, Dict, List
-
-
-class Priority(Enum):
+from urllib3.util.retry import Retry
+
+# orjson decodes straight from bytes and is noticeably faster than the
+# stdlib json module; fall back transparently when it isn't installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# httpx is only needed by the AsyncPushover client; HTTP/2 multiplexing
+# additionally requires the h2 package (pip install httpx[http2])
+try:
+    import httpx
+    try:
+        import h2  # noqa: F401
+        _HTTP2 = True
+    except ImportError:
+        _HTTP2 = False
+except ImportError:
+    httpx = None
+    _HTTP2 = False
+
+
+def _decode_response(response) -> Dict:
+    """
+    Decode an API reply body, checking the HTTP status first
+
+    Server errors and non-JSON bodies raise PushoverError directly rather
+    than letting a JSON parse failure mask the real HTTP status. Works on
+    both requests and httpx responses.
+    """
+    status = response.status_code
+    if status >= 500:
+        raise PushoverError(f"API server error: {status}")
+    if "application/json" not in response.headers.get("content-type", ""):
+        raise PushoverError(f"API request failed with status {status}: non-JSON response")
+    return _loads(response.content)
+
+
+@lru_cache(maxsize=128)
+def _guess_mime(path: str) -> str:
+    """MIME type for an attachment path, cached per filename"""
+    return mimetypes.guess_type(path)[0] or "image/jpeg"
+
+
+class Priority(IntEnum):
+    """Message priority levels; IntEnum so members compare as plain ints"""
     LOWEST = -2  # No notification/alert
     LOW = -1  # No sound/vibration
     NORMAL = 0  # Default priority
@@ -12,9 +64,18 @@ class Priority(Enum):
     EMERGENCY = 2  # Requires confirmation
 
 
-@dataclass
+# Module-level int so the hot path compares raw ints instead of paying
+# Enum descriptor lookups per send
+_EMERGENCY = Priority.EMERGENCY.value
+
+
+@dataclass(slots=True, frozen=True)
 class GlancesData:
-    """Container for Glances data fields"""
+    """Container for Glances data fields
+
+    Instances are immutable; construct a fresh GlancesData for each
+    update rather than mutating fields in place.
+    """
     title: Optional[str] = None  # 100 chars max - description of the data
     text: Optional[str] = None  # 100 chars max - main line of data
     subtext: Optional[str] = None  # 100 chars max - second line of data
@@ -23,23 +84,33 @@ class GlancesData:
 
     def validate(self):
         """Validate glances data fields"""
-        if self.title and len(self.title) > 100:
-            raise ValueError("title must be 100 characters or less")
-        if self.text and len(self.text) > 100:
-            raise ValueError("text must be 100 characters or less")
-        if self.subtext and len(self.subtext) > 100:
-            raise ValueError("subtext must be 100 characters or less")
+        for name, value in (("title", self.title), ("text", self.text), ("subtext", self.subtext)):
+            if value is not None and len(value) > 100:
+                raise ValueError(f"{name} must be 100 characters or less")
         if self.percent is not None and not (0 <= self.percent <= 100):
             raise ValueError("percent must be between 0 and 100")
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for API request"""
-        data = {}
-        if self.title is not None: data["title"] = self.title
-        if self.text is not None: data["text"] = self.text
-        if self.subtext is not None: data["subtext"] = self.subtext
-        if self.count is not None: data["count"] = self.count
-        if self.percent is not None: data["percent"] = self.percent
+    def to_dict(self, out: Optional[Dict] = None) -> Dict:
+        """
+        Convert to dictionary for API request
+
+        Args:
+            out: Optional existing dict to populate in place, saving the
+                intermediate allocation when building a request payload
+
+        Returns:
+            The populated dictionary (out if given, else a new dict)
+        """
+        data = {} if out is None else out
+        for key, value in (
+                ("title", self.title),
+                ("text", self.text),
+                ("subtext", self.subtext),
+                ("count", self.count),
+                ("percent", self.percent),
+        ):
+            if value is not None:
+                data[key] = value
         return data
 
 
@@ -48,7 +119,7 @@ class PushoverError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PushoverResponse:
     """Container for Pushover API responses"""
     status: int
@@ -57,18 +128,296 @@ class PushoverResponse:
     errors: Optional[List[str]] = None
 
 
+class _CircuitBreaker:
+    """In-process circuit breaker guarding outbound API calls
+
+    After failure_threshold consecutive failures the breaker opens and
+    calls raise PushoverError immediately without a network round-trip.
+    Once reset_timeout seconds have passed, a single half-open probe is
+    allowed through; success closes the breaker, failure re-opens it.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30,
+                 half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self.opened_at = 0.0
+        self._half_open_calls = 0
+
+    def before_call(self):
+        """Raise PushoverError if the breaker disallows a call right now"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise PushoverError("Circuit breaker open: too many consecutive API failures")
+            self.state = self.HALF_OPEN
+            self._half_open_calls = 0
+        if self.state == self.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                raise PushoverError("Circuit breaker half-open: probe already in flight")
+            self._half_open_calls += 1
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.fail_count = 0
+
+    def record_failure(self):
+        self.fail_count += 1
+        if self.state == self.HALF_OPEN or self.fail_count >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class _JitterRetry(Retry):
+    """Retry policy with a small random jitter added to each backoff so
+    concurrent senders don't retry in lockstep"""
+
+    def get_backoff_time(self):
+        return super().get_backoff_time() + random.uniform(0, 0.3)
+
+
+def _build_session(pool_connections: int = 2, pool_maxsize: int = 32) -> requests.Session:
+    """Create a requests session with the retry policy mounted: transient
+    failures (DNS blips, 502/503 from the API) are retried with
+    exponential backoff + jitter before surfacing to the caller"""
+    session = requests.Session()
+    session.headers.update({"User-Agent": "Pushover-Python"})
+    retries = _JitterRetry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Every Pushover instance talks to the same api.pushover.net host, so one
+# process-wide session (and circuit breaker) is shared across instances:
+# multi-tenant processes pool TLS connections no matter which client
+# object sends. Emergency sends must not be retried (a duplicate POST
+# would schedule a second receipt), so they go through the bare adapter.
+_SHARED_SESSION = _build_session()
+_SHARED_NO_RETRY_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=32)
+_SHARED_BREAKER = _CircuitBreaker()
+
+
 class Pushover:
     """Main class for interacting with the Pushover API"""
     BASE_URL = "https://api.pushover.net/1"
-
-    def __init__(self, app_token: str):
+    # Endpoint URLs, built once instead of f-string formatted per call
+    _URL_MESSAGES = BASE_URL + "/messages.json"
+    _URL_VALIDATE = BASE_URL + "/users/validate.json"
+    _URL_SOUNDS = BASE_URL + "/sounds.json"
+    _URL_GLANCES = BASE_URL + "/glances.json"
+    _URL_RECEIPTS_PREFIX = BASE_URL + "/receipts/"
+    DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+    SOUNDS_CACHE_TTL = 3600  # seconds to cache the get_sounds result
+
+    def __init__(self, app_token: str, timeout: Optional[tuple] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize Pushover client
 
         Args:
             app_token: Your application's API token
+            timeout: Optional (connect, read) timeout in seconds,
+                defaults to DEFAULT_TIMEOUT
+            session: Optional requests.Session to use instead of the
+                module-level shared session
         """
         self.app_token = app_token
+        self._timeout = timeout or self.DEFAULT_TIMEOUT
+        # Shared payload base copied into every request body
+        self._base_payload = {"token": app_token}
+        # (fetched_at, sounds) pair for the get_sounds TTL cache
+        self._sounds_cache: Optional[tuple] = None
+        # Instances default to the process-wide session and breaker so
+        # keep-alive connections are shared; a caller-supplied session
+        # gets its own breaker since its failures are its own
+        if session is None:
+            self._session = _SHARED_SESSION
+            self._breaker = _SHARED_BREAKER
+        else:
+            self._session = session
+            self._breaker = _CircuitBreaker()
+        self._no_retry_adapter = _SHARED_NO_RETRY_ADAPTER
+
+    def _request(self, method: str, url: str, allow_retries: bool = True,
+                 **kwargs) -> requests.Response:
+        """
+        Issue an HTTP request through the session, guarded by the circuit
+        breaker: network errors and 5xx responses count as failures, 2xx
+        responses reset the breaker
+
+        Args:
+            allow_retries: When False the request bypasses the retry
+                adapter (used for emergency sends, which must not be
+                duplicated)
+
+        Raises:
+            PushoverError: If the circuit breaker is open
+        """
+        self._breaker.before_call()
+        try:
+            if allow_retries:
+                response = self._session.request(method, url, **kwargs)
+            else:
+                timeout = kwargs.pop("timeout", self._timeout)
+                prepared = self._session.prepare_request(
+                    requests.Request(method, url, **kwargs)
+                )
+                response = self._no_retry_adapter.send(prepared, timeout=timeout)
+        except requests.exceptions.RequestException:
+            self._breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            # Any completed non-5xx reply (4xx included) proves the server
+            # is reachable, so it resolves a half-open probe and resets
+            # the breaker rather than leaving the probe slot consumed
+            self._breaker.record_success()
+        return response
+
+    def _send_prepared(self, prepared: requests.PreparedRequest,
+                       timeout: Optional[tuple] = None,
+                       allow_retries: bool = True) -> requests.Response:
+        """
+        Send an already-prepared request through the session with the same
+        circuit-breaker accounting as _request
+
+        Args:
+            allow_retries: When False the request goes through the bare
+                no-retry adapter (used for emergency sends, which must
+                not be duplicated)
+
+        Raises:
+            PushoverError: If the circuit breaker is open
+        """
+        self._breaker.before_call()
+        try:
+            if allow_retries:
+                response = self._session.send(prepared, timeout=timeout or self._timeout)
+            else:
+                response = self._no_retry_adapter.send(prepared, timeout=timeout or self._timeout)
+        except requests.exceptions.RequestException:
+            self._breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            # Any completed non-5xx reply (4xx included) proves the server
+            # is reachable, so it resolves a half-open probe and resets
+            # the breaker rather than leaving the probe slot consumed
+            self._breaker.record_success()
+        return response
+
+    def close(self):
+        """
+        Close this client's HTTP session
+
+        The module-level shared session and adapter are left open, since
+        other Pushover instances in the process may still be using them.
+        """
+        if self._session is not _SHARED_SESSION:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _build_message_payload(
+            user_key: str,
+            message: str,
+            title: Optional[str] = None,
+            device: Optional[str] = None,
+            priority: Priority = Priority.NORMAL,
+            sound: Optional[str] = None,
+            url: Optional[str] = None,
+            url_title: Optional[str] = None,
+            timestamp: Optional[int] = None,
+            html: bool = False,
+            monospace: bool = False,
+            ttl: Optional[int] = None,
+            retry: Optional[int] = None,
+            expire: Optional[int] = None,
+            callback_url: Optional[str] = None,
+    ) -> Dict:
+        """
+        Build the form payload for a /messages.json POST (token excluded),
+        shared by the sync and async clients
+
+        Raises:
+            ValueError: If a field exceeds the API's documented limits or
+                emergency priority parameters are invalid
+        """
+        # Fail fast on length limits the API would reject anyway, before
+        # paying for a network round-trip
+        for name, value, limit in (
+                ("message", message, 1024),
+                ("title", title, 250),
+                ("url", url, 512),
+                ("url_title", url_title, 100),
+                ("device", device, 25),
+        ):
+            if value and len(value) > limit:
+                raise ValueError(f"{name} must be {limit} characters or less")
+
+        prio_val = priority.value  # hoisted: .value is a descriptor lookup
+        payload = {
+            "user": user_key,
+            "message": message,
+            "priority": prio_val
+        }
+
+        # Add optional parameters, table-driven to keep the hot path flat
+        for key, value in (
+                ("title", title),
+                ("device", device),
+                ("sound", sound),
+                ("url", url),
+                ("url_title", url_title),
+                ("timestamp", timestamp),
+                ("ttl", ttl),
+        ):
+            if value:
+                payload[key] = value
+        # Flags are only set when enabled; direct conditional assignment is
+        # the cheapest form here (no intermediate dict or int() call)
+        if html: payload["html"] = 1
+        if monospace: payload["monospace"] = 1
+
+        # Add emergency priority parameters
+        if prio_val == _EMERGENCY:
+            if not retry or not expire:
+                raise ValueError("Emergency priority requires retry and expire parameters")
+            if retry < 30:
+                raise ValueError("retry must be at least 30 seconds")
+            if expire > 10800:
+                raise ValueError("expire must be at most 10800 seconds (3 hours)")
+
+            payload["retry"] = retry
+            payload["expire"] = expire
+            if callback_url:
+                payload["callback"] = callback_url
+
+        return payload
 
     def send_message(
             self,
@@ -116,56 +465,51 @@ class Pushover:
         Raises:
             PushoverError: If the API request fails
         """
-        # Build payload
+        # Build payload from the prebuilt base
         payload = {
-            "token": self.app_token,
-            "user": user_key,
-            "message": message,
-            "priority": priority.value
+            **self._base_payload,
+            **self._build_message_payload(
+                user_key, message, title, device, priority, sound, url,
+                url_title, timestamp, html, monospace, ttl, retry, expire,
+                callback_url
+            )
         }
 
-        # Add optional parameters
-        if title: payload["title"] = title
-        if device: payload["device"] = device
-        if sound: payload["sound"] = sound
-        if url: payload["url"] = url
-        if url_title: payload["url_title"] = url_title
-        if timestamp: payload["timestamp"] = timestamp
-        if html: payload["html"] = 1
-        if monospace: payload["monospace"] = 1
-        if ttl: payload["ttl"] = ttl
-
-        # Add emergency priority parameters
-        if priority == Priority.EMERGENCY:
-            if not retry or not expire:
-                raise ValueError("Emergency priority requires retry and expire parameters")
-            if retry < 30:
-                raise ValueError("retry must be at least 30 seconds")
-            if expire > 10800:
-                raise ValueError("expire must be at most 10800 seconds (3 hours)")
-
-            payload["retry"] = retry
-            payload["expire"] = expire
-            if callback_url:
-                payload["callback"] = callback_url
-
-        files = None
+        timeout = self._timeout
         if attachment:
             try:
-                files = {
-                    "attachment": ("image.jpg", open(attachment, "rb"), "image/jpeg")
-                }
-            except Exception as e:
+                fh = open(attachment, "rb")
+                # Scale the read timeout with attachment size so large
+                # uploads aren't cut off by the default
+                timeout = (timeout[0], max(timeout[1], os.path.getsize(attachment) / 50_000))
+            except OSError as e:
                 raise PushoverError(f"Failed to read attachment: {str(e)}")
+        else:
+            fh = None
 
         # Make the API request
         try:
-            response = requests.post(
-                f"{self.BASE_URL}/messages.json",
+            files = None
+            if fh is not None:
+                # Hand requests the open handle so the image is read lazily
+                # rather than slurped upfront, with the real filename and
+                # MIME type instead of a hardcoded image.jpg
+                files = {
+                    "attachment": (
+                        os.path.basename(attachment),
+                        fh,
+                        _guess_mime(attachment)
+                    )
+                }
+            response = self._request(
+                "POST",
+                self._URL_MESSAGES,
                 data=payload,
-                files=files
+                files=files,
+                timeout=timeout,
+                allow_retries=priority is not Priority.EMERGENCY
             )
-            data = response.json()
+            data = _decode_response(response)
 
             if response.status_code != 200:
                 raise PushoverError(f"API request failed: {data.get('errors', ['Unknown error'])}")
@@ -178,6 +522,93 @@ class Pushover:
 
         except requests.exceptions.RequestException as e:
             raise PushoverError(f"Request failed: {str(e)}")
+        finally:
+            if fh is not None:
+                fh.close()
+
+    def send_bulk(self, user_keys: List[str], message: str, **kwargs) -> List[PushoverResponse]:
+        """
+        Send the same message to many users in as few API calls as possible
+
+        The API accepts up to 50 comma-separated user keys per request,
+        so the keys are chunked into groups of 50 and one request is
+        issued per chunk instead of one per user.
+
+        Args:
+            user_keys: List of user/group keys
+            message: The message body
+            **kwargs: Any other send_message keyword arguments
+
+        Returns:
+            List of PushoverResponse objects, one per API call made
+
+        Raises:
+            PushoverError: If any API request fails
+        """
+        responses = []
+        for start in range(0, len(user_keys), 50):
+            chunk = user_keys[start:start + 50]
+            responses.append(self.send_message(",".join(chunk), message, **kwargs))
+        return responses
+
+    def build_message_sender(self, user_key: str, **fixed_kwargs):
+        """
+        Build a reusable sender for repeated same-shape notifications
+
+        The fixed fields are validated, encoded, and prepared into a
+        request template once; the returned callable only swaps the
+        per-call fields (message plus any overrides) before sending, so
+        high-volume senders skip payload construction and request
+        preparation on every call.
+
+        Args:
+            user_key: The user/group key every send targets
+            **fixed_kwargs: send_message keyword arguments that stay the
+                same for every send (title, priority, sound, ...)
+
+        Returns:
+            Callable taking (message, **overrides) and returning a
+            PushoverResponse
+
+        Raises:
+            ValueError: If the fixed fields fail validation
+        """
+        fixed_payload = {
+            **self._base_payload,
+            **self._build_message_payload(user_key, "", **fixed_kwargs)
+        }
+        del fixed_payload["message"]
+        # Emergency sends must skip the retry adapter, same as send_message
+        allow_retries = fixed_payload.get("priority") != _EMERGENCY
+        template = self._session.prepare_request(
+            requests.Request("POST", self._URL_MESSAGES, data=fixed_payload)
+        )
+
+        def send(message: str, **overrides) -> PushoverResponse:
+            if len(message) > 1024:
+                raise ValueError("message must be 1024 characters or less")
+            # PreparedRequest.copy() clones the headers, so the template
+            # stays pristine while we swap in the per-call body
+            prepared = template.copy()
+            body = urlencode({**fixed_payload, "message": message, **overrides})
+            prepared.body = body
+            prepared.headers["Content-Length"] = str(len(body))
+            try:
+                response = self._send_prepared(prepared, allow_retries=allow_retries)
+            except requests.exceptions.RequestException as e:
+                raise PushoverError(f"Request failed: {str(e)}")
+
+            data = _decode_response(response)
+            if response.status_code != 200:
+                raise PushoverError(f"API request failed: {data.get('errors', ['Unknown error'])}")
+
+            return PushoverResponse(
+                status=data["status"],
+                request_id=data["request"],
+                receipt=data.get("receipt")
+            )
+
+        return send
 
     def validate_user(self, user_key: str, device: Optional[str] = None) -> bool:
         """
@@ -190,21 +621,23 @@ class Pushover:
         Returns:
             True if valid, False otherwise
         """
-        payload = {
-            "token": self.app_token,
-            "user": user_key
-        }
+        payload = {**self._base_payload, "user": user_key}
         if device:
             payload["device"] = device
 
         try:
-            response = requests.post(
-                f"{self.BASE_URL}/users/validate.json",
-                data=payload
+            response = self._request(
+                "POST",
+                self._URL_VALIDATE,
+                data=payload,
+                timeout=self._timeout
             )
-            data = response.json()
+            # Skip the JSON parse entirely on a non-200 reply
+            if response.status_code != 200:
+                return False
+            data = _loads(response.content)
             return data.get("status") == 1
-        except:
+        except (requests.exceptions.RequestException, PushoverError, ValueError, KeyError):
             return False
 
     def check_receipt(self, receipt: str) -> Dict:
@@ -221,15 +654,17 @@ class Pushover:
             PushoverError: If the API request fails
         """
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/receipts/{receipt}.json",
-                params={"token": self.app_token}
+            response = self._request(
+                "GET",
+                f"{self._URL_RECEIPTS_PREFIX}{receipt}.json",
+                params={"token": self.app_token},
+                timeout=self._timeout
             )
 
             if response.status_code != 200:
                 raise PushoverError("Failed to check receipt")
 
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             raise PushoverError(f"Request failed: {str(e)}")
 
@@ -244,36 +679,56 @@ class Pushover:
             True if successful, False otherwise
         """
         try:
-            response = requests.post(
-                f"{self.BASE_URL}/receipts/{receipt}/cancel.json",
-                data={"token": self.app_token}
+            response = self._request(
+                "POST",
+                f"{self._URL_RECEIPTS_PREFIX}{receipt}/cancel.json",
+                data={"token": self.app_token},
+                timeout=self._timeout
             )
             return response.status_code == 200
-        except:
+        except (requests.exceptions.RequestException, PushoverError):
             return False
 
     def get_sounds(self) -> Dict[str, str]:
         """
         Get list of available notification sounds
 
+        The sound list changes very rarely, so results are cached for
+        SOUNDS_CACHE_TTL seconds; if a refresh fails, a stale cached copy
+        is served rather than raising.
+
         Returns:
             Dictionary of sound name to description mappings
 
         Raises:
-            PushoverError: If the API request fails
+            PushoverError: If the API request fails and no cached copy exists
         """
+        cached = self._sounds_cache
+        if cached is not None and time.monotonic() - cached[0] < self.SOUNDS_CACHE_TTL:
+            return cached[1]
+
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/sounds.json",
-                params={"token": self.app_token}
+            response = self._request(
+                "GET",
+                self._URL_SOUNDS,
+                params={"token": self.app_token},
+                timeout=self._timeout
             )
 
             if response.status_code != 200:
                 raise PushoverError("Failed to get sounds")
 
-            data = response.json()
-            return data.get("sounds", {})
-        except requests.exceptions.RequestException as e:
+            data = _loads(response.content)
+            sounds = data.get("sounds", {})
+            self._sounds_cache = (time.monotonic(), sounds)
+            return sounds
+        except (requests.exceptions.RequestException, PushoverError) as e:
+            # Any refresh failure — network error, non-200 reply, or an
+            # open circuit breaker — falls back to the stale copy
+            if cached is not None:
+                return cached[1]
+            if isinstance(e, PushoverError):
+                raise
             raise PushoverError(f"Request failed: {str(e)}")
 
     def update_glance(
@@ -305,23 +760,23 @@ class Pushover:
         # Validate the glances data
         glances_data.validate()
 
-        # Build payload
-        payload = {
-            "token": self.app_token,
-            "user": user_key,
-            **glances_data.to_dict()
-        }
+        # Build payload, letting to_dict fill it in place rather than
+        # merging an intermediate dict
+        payload = {**self._base_payload, "user": user_key}
+        glances_data.to_dict(out=payload)
 
         if device:
             payload["device"] = device
 
         # Make the API request
         try:
-            response = requests.post(
-                f"{self.BASE_URL}/glances.json",
-                data=payload
+            response = self._request(
+                "POST",
+                self._URL_GLANCES,
+                data=payload,
+                timeout=self._timeout
             )
-            data = response.json()
+            data = _decode_response(response)
 
             if response.status_code != 200:
                 raise PushoverError(f"API request failed: {data.get('errors', ['Unknown error'])}")
@@ -335,6 +790,105 @@ class Pushover:
             raise PushoverError(f"Request failed: {str(e)}")
 
 
+class AsyncPushover:
+    """Async variant of the Pushover client built on httpx
+
+    Coroutines can be awaited concurrently (e.g. with asyncio.gather),
+    bounded by the client's connection pool, so hundreds of sends overlap
+    instead of serializing one round-trip at a time. Requires the
+    optional httpx dependency; install httpx[http2] to enable HTTP/2
+    multiplexing.
+    """
+    BASE_URL = Pushover.BASE_URL
+
+    def __init__(self, app_token: str):
+        """
+        Initialize async Pushover client
+
+        Args:
+            app_token: Your application's API token
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("AsyncPushover requires the optional httpx package")
+        self.app_token = app_token
+        self._base_payload = {"token": app_token}
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2,
+            base_url=self.BASE_URL,
+            timeout=httpx.Timeout(10, connect=3),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={"User-Agent": "Pushover-Python"}
+        )
+
+    async def aclose(self):
+        """Close the underlying HTTP client and its connection pool"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def send_message(
+            self,
+            user_key: str,
+            message: str,
+            title: Optional[str] = None,
+            device: Optional[str] = None,
+            priority: Priority = Priority.NORMAL,
+            sound: Optional[str] = None,
+            url: Optional[str] = None,
+            url_title: Optional[str] = None,
+            timestamp: Optional[int] = None,
+            html: bool = False,
+            monospace: bool = False,
+            ttl: Optional[int] = None,
+            retry: Optional[int] = None,
+            expire: Optional[int] = None,
+            callback_url: Optional[str] = None,
+    ) -> PushoverResponse:
+        """
+        Send a message to a user or group (async)
+
+        Mirrors Pushover.send_message except for attachments, which are
+        not supported on the async path.
+
+        Returns:
+            PushoverResponse object containing status and request details
+
+        Raises:
+            PushoverError: If the API request fails
+        """
+        payload = {
+            **self._base_payload,
+            **Pushover._build_message_payload(
+                user_key, message, title, device, priority, sound, url,
+                url_title, timestamp, html, monospace, ttl, retry, expire,
+                callback_url
+            )
+        }
+
+        try:
+            response = await self._client.post("/messages.json", data=payload)
+            data = _decode_response(response)
+
+            if response.status_code != 200:
+                raise PushoverError(f"API request failed: {data.get('errors', ['Unknown error'])}")
+
+            return PushoverResponse(
+                status=data["status"],
+                request_id=data["request"],
+                receipt=data.get("receipt")
+            )
+
+        except httpx.HTTPError as e:
+            raise PushoverError(f"Request failed: {str(e)}")
+
+
 # Example usage:
 if __name__ == "__main__":
     # Initialize client